@@ -5,6 +5,7 @@ This MCP server provides comprehensive access to YouTube data including transcri
 
 ## Environment Variables
 - YOUTUBE_API_KEY: Required. API key for YouTube Data API v3. Obtain from Google Cloud Console with YouTube Data API enabled.
+- REDIS_URL: Optional. Redis connection URL (e.g., redis://localhost:6379/0) used as a shared cache for API responses. Requires the redis package.
 
 ## Required Permissions
 - YouTube Data API v3: Read-only access to public video data (snippets, search, comments).
@@ -13,7 +14,7 @@ This MCP server provides comprehensive access to YouTube data including transcri
 - Restrict API key to specific IPs or referrers for security.
 
 ## Setup Instructions
-1. Install dependencies: pip install fastmcp pydantic httpx youtube-transcript-api
+1. Install dependencies: pip install fastmcp pydantic 'httpx[http2]' orjson async-lru 'youtube-transcript-api>=1.0' (optionally uvloop for a faster event loop)
 2. Set environment variable: export YOUTUBE_API_KEY=your_api_key_here
 3. Run the server: python this_file.py
 
@@ -24,19 +25,28 @@ This MCP server provides comprehensive access to YouTube data including transcri
 """
 
 import asyncio
+import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, List, Optional, Set, Tuple
 
 import httpx
+import orjson
+import requests
+from async_lru import alru_cache
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator, ConfigDict
+from pydantic import BaseModel, Field, StringConstraints, ConfigDict
+from youtube_transcript_api import FetchedTranscript, YouTubeTranscriptApi
 
 
 class Config:
     '''Configuration with environment variable validation'''
     # Define all required environment variables
     YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+    REDIS_URL = os.getenv("REDIS_URL")
     
     @classmethod
     def validate(cls) -> None:
@@ -63,67 +73,41 @@ class ResponseFormat(Enum):
 
 CHARACTER_LIMIT = 5000
 
+# Validated natively by pydantic-core: video IDs are exactly 11 characters, queries must not be blank
+VideoId = Annotated[str, StringConstraints(min_length=11, max_length=11)]
+SearchQuery = Annotated[str, StringConstraints(min_length=1, strip_whitespace=True)]
+
 
 class TranscriptRequest(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    
-    video_id: str = Field(..., description="The YouTube video ID (e.g., 'dQw4w9WgXcQ')")
+    model_config = ConfigDict(extra='forbid', frozen=True)
     
-    @field_validator('video_id')
-    @classmethod
-    def validate_video_id(cls, v: str, info: ValidationInfo) -> str:
-        """Validate video_id format"""
-        if not v or len(v) != 11:
-            raise ValueError("video_id must be exactly 11 characters")
-        return v
+    video_id: VideoId = Field(..., description="The YouTube video ID (e.g., 'dQw4w9WgXcQ')")
 
 
 class TranscriptResponse(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    
     transcript: str = Field(..., description="The full transcript of the YouTube video")
     video_title: Optional[str] = Field(None, description="The title of the YouTube video")
     video_description: Optional[str] = Field(None, description="The description of the YouTube video")
 
 
 class SearchRequest(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(extra='forbid', frozen=True)
     
-    query: str = Field(..., description="Search query for YouTube videos")
+    query: SearchQuery = Field(..., description="Search query for YouTube videos")
     max_results: int = Field(5, description="Maximum number of results (1-50)", ge=1, le=50)
-    
-    @field_validator('query')
-    @classmethod
-    def validate_query(cls, v: str, info: ValidationInfo) -> str:
-        """Validate search query"""
-        if not v or not v.strip():
-            raise ValueError("query cannot be empty")
-        return v.strip()
 
 
 class SearchResponse(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    
     videos: List[Dict[str, Any]] = Field(..., description="List of video search results")
 
 
 class VideoDetailsRequest(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    
-    video_id: str = Field(..., description="The YouTube video ID")
+    model_config = ConfigDict(extra='forbid', frozen=True)
     
-    @field_validator('video_id')
-    @classmethod
-    def validate_video_id(cls, v: str, info: ValidationInfo) -> str:
-        """Validate video_id format"""
-        if not v or len(v) != 11:
-            raise ValueError("video_id must be exactly 11 characters")
-        return v
+    video_id: VideoId = Field(..., description="The YouTube video ID")
 
 
 class VideoDetailsResponse(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    
     video_id: str = Field(..., description="The YouTube video ID")
     title: str = Field(..., description="The title of the video")
     description: str = Field(..., description="The description of the video")
@@ -131,34 +115,259 @@ class VideoDetailsResponse(BaseModel):
 
 
 class CommentsRequest(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(extra='forbid', frozen=True)
     
-    video_id: str = Field(..., description="The YouTube video ID")
+    video_id: VideoId = Field(..., description="The YouTube video ID")
     max_results: int = Field(20, description="Maximum number of comments (1-100)", ge=1, le=100)
-    
-    @field_validator('video_id')
-    @classmethod
-    def validate_video_id(cls, v: str, info: ValidationInfo) -> str:
-        """Validate video_id format"""
-        if not v or len(v) != 11:
-            raise ValueError("video_id must be exactly 11 characters")
-        return v
 
 
 class CommentsResponse(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    
     comments: List[str] = Field(..., description="List of top-level comments")
 
 
+# Upper bound on in-flight YouTube Data API requests; new requests start as soon as a slot frees
+MAX_CONCURRENT_API_REQUESTS = 50
+
+# Shared HTTP client so connections to the YouTube Data API are pooled and reused across calls;
+# the API key is sent as a client-level default query parameter on every request
+_client = httpx.AsyncClient(
+    base_url="https://www.googleapis.com/youtube/v3",
+    params={"key": Config.YOUTUBE_API_KEY},
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=MAX_CONCURRENT_API_REQUESTS),
+)
+_api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_REQUESTS)
+
+# youtube-transcript-api only offers a blocking interface, so transcripts are fetched
+# on a dedicated pool sized like the HTTP connection pool rather than the small default executor
+TRANSCRIPT_WORKERS = 50
+_transcript_executor = ThreadPoolExecutor(max_workers=TRANSCRIPT_WORKERS, thread_name_prefix="transcript")
+
+# YouTubeTranscriptApi and its requests.Session are not thread-safe, so each worker builds its own
+_transcript_local = threading.local()
+_transcript_sessions: List[requests.Session] = []
+
+
+def _fetch_transcript(video_id: str) -> FetchedTranscript:
+    """Fetch a transcript with the calling worker thread's own YouTubeTranscriptApi"""
+    api = getattr(_transcript_local, "api", None)
+    if api is None:
+        session = requests.Session()
+        _transcript_sessions.append(session)
+        api = _transcript_local.api = YouTubeTranscriptApi(http_client=session)
+    return api.fetch(video_id)
+
+
+# Optional shared cache, enabled by setting REDIS_URL
+if Config.REDIS_URL:
+    import redis.asyncio as redis
+    _redis = redis.from_url(Config.REDIS_URL)
+else:
+    _redis = None
+
+# Response cache TTLs in seconds, keyed by API endpoint
+CACHE_TTLS = {
+    "search": 6 * 3600,
+    "commentThreads": 300,
+}
+
+# Video snippets are cached per video ID rather than per videos response
+SNIPPET_CACHE_TTL = 12 * 3600
+
+# Static query params per endpoint; fields requests partial responses with only the keys each tool reads
+VIDEOS_PARAMS = MappingProxyType({
+    "part": "snippet",
+    "fields": "items(id,snippet(title,description,publishedAt))",
+})
+SEARCH_PARAMS = MappingProxyType({
+    "part": "snippet",
+    "type": "video",
+    "fields": "items(id/videoId,snippet(title,description))",
+})
+COMMENTS_PARAMS = MappingProxyType({
+    "part": "snippet",
+    "fields": "items(snippet/topLevelComment/snippet/textDisplay)",
+})
+
+# Maximum number of response body bytes included in API error messages
+ERROR_BODY_LIMIT = 512
+
+
+async def _http_get(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Helper function to send a GET request to YouTube Data API"""
+    async with _api_semaphore:
+        response = await _client.get(url, params=params)
+    if not response.is_success:
+        raise ValueError(f"API request failed: {response.status_code} - {response.content[:ERROR_BODY_LIMIT]!r}")
+    return orjson.loads(response.content)
+
+
+def _cache_key(url: str, items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Build a canonical cache key from the endpoint URL and sorted query params"""
+    url_hash = hashlib.sha1(url.encode()).hexdigest()[:12]
+    params_hash = hashlib.sha1(repr(items).encode()).hexdigest()
+    return f"yt:{url_hash}:{params_hash}"
+
+
+async def _cached_get(url: str, items: Tuple[Tuple[str, Any], ...], ttl: int) -> Dict[str, Any]:
+    """Fetch an API response, going through Redis first when it is configured"""
+    if _redis is None:
+        return await _http_get(url, dict(items))
+
+    # Redis is only a cache: a failed read falls through to the API and a failed write is ignored
+    cache_key = _cache_key(url, items)
+    try:
+        cached = await _redis.get(cache_key)
+    except redis.RedisError:
+        cached = None
+    if cached is not None:
+        return orjson.loads(cached)
+
+    data = await _http_get(url, dict(items))
+    try:
+        await _redis.setex(cache_key, ttl, orjson.dumps(data))
+    except redis.RedisError:
+        pass
+    return data
+
+
+# One in-process LRU per endpoint so each honours its own TTL
+_cached_getters = {
+    endpoint: alru_cache(maxsize=4096, ttl=ttl)(_cached_get)
+    for endpoint, ttl in CACHE_TTLS.items()
+}
+
+
 async def _make_api_request(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Helper function to make API requests to YouTube Data API"""
-    params['key'] = Config.YOUTUBE_API_KEY
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params)
-        if response.status_code != 200:
-            raise ValueError(f"API request failed: {response.status_code} - {response.text}")
-        return response.json()
+    """Helper function to make cached API requests to YouTube Data API
+
+    The returned data may be shared with other callers and must not be mutated.
+    """
+    endpoint = url.rsplit("/", 1)[-1]
+    ttl = CACHE_TTLS.get(endpoint)
+    if ttl is None:
+        return await _http_get(url, params)
+    return await _cached_getters[endpoint](url, tuple(sorted(params.items())), ttl)
+
+
+# Video snippet lookups are coalesced into batched calls to the videos endpoint
+VIDEO_BATCH_SIZE = 50  # maximum number of IDs the videos endpoint accepts per call
+VIDEO_BATCH_WINDOW = 0.02  # seconds to wait for more IDs before sending a batch
+
+_snippet_queue: Optional[asyncio.Queue] = None
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> None:
+    """Run a coroutine in the background, keeping a reference until it finishes"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _snippet_cache_key(video_id: str) -> str:
+    """Build the Redis key under which a single video's snippet is cached"""
+    return f"yt:snippet:{video_id}"
+
+
+async def _store_snippets(snippets: Dict[str, Dict[str, Any]]) -> None:
+    """Write fetched snippets to Redis one key per video; failures are ignored"""
+    if _redis is None or not snippets:
+        return
+    try:
+        async with _redis.pipeline(transaction=False) as pipe:
+            for video_id, snippet in snippets.items():
+                pipe.setex(_snippet_cache_key(video_id), SNIPPET_CACHE_TTL, orjson.dumps(snippet))
+            await pipe.execute()
+    except redis.RedisError:
+        pass
+
+
+async def _fetch_snippets(batch: Dict[str, List[asyncio.Future]]) -> None:
+    """Fetch snippets for a batch of video IDs and resolve the waiting futures
+
+    Batches bypass the response cache; snippets are cached per video ID instead.
+    """
+    try:
+        url = "/videos"
+        params = {**VIDEOS_PARAMS, "id": ",".join(sorted(batch))}
+        data = await _http_get(url, params)
+        snippets = {item['id']: item['snippet'] for item in data.get('items', [])}
+    except Exception as e:
+        for futures in batch.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        return
+
+    for video_id, futures in batch.items():
+        for future in futures:
+            if not future.done():
+                future.set_result(snippets.get(video_id))
+    await _store_snippets(snippets)
+
+
+async def _snippet_batcher(queue: asyncio.Queue) -> None:
+    """Drain queued video IDs into batches of up to VIDEO_BATCH_SIZE"""
+    loop = asyncio.get_running_loop()
+    while True:
+        video_id, future = await queue.get()
+        batch = {video_id: [future]}
+        deadline = loop.time() + VIDEO_BATCH_WINDOW
+        while len(batch) < VIDEO_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                video_id, future = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.setdefault(video_id, []).append(future)
+        _spawn(_fetch_snippets(batch))
+
+
+class _VideoNotFound(Exception):
+    """Raised by the snippet cache for missing videos, so misses are never cached"""
+
+
+@alru_cache(maxsize=4096, ttl=SNIPPET_CACHE_TTL)
+async def _lookup_video_snippet(video_id: str) -> Dict[str, Any]:
+    """Look up the snippet for a video, caching hits per video ID
+
+    Snippets are cached in-process and in Redis when configured, so a lookup hits the
+    cache no matter which batch originally fetched the video.
+    """
+    if _redis is not None:
+        try:
+            cached = await _redis.get(_snippet_cache_key(video_id))
+        except redis.RedisError:
+            cached = None
+        if cached is not None:
+            return orjson.loads(cached)
+
+    global _snippet_queue
+    if _snippet_queue is None:
+        _snippet_queue = asyncio.Queue()
+        _spawn(_snippet_batcher(_snippet_queue))
+
+    future = asyncio.get_running_loop().create_future()
+    await _snippet_queue.put((video_id, future))
+    snippet = await future
+    if snippet is None:
+        raise _VideoNotFound(video_id)
+    return snippet
+
+
+async def _get_video_snippet(video_id: str) -> Optional[Dict[str, Any]]:
+    """Get the snippet for a video, or None if the video does not exist
+
+    The returned data may be shared with other callers and must not be mutated.
+    """
+    try:
+        return await _lookup_video_snippet(video_id)
+    except _VideoNotFound:
+        return None
 
 
 def _handle_api_error(e: Exception) -> str:
@@ -166,6 +375,27 @@ def _handle_api_error(e: Exception) -> str:
     return f"API Error: {str(e)}"
 
 
+async def _search_videos(request: SearchRequest) -> SearchResponse:
+    """Helper function shared by the search tools to query the search endpoint"""
+    try:
+        url = "/search"
+        params = {**SEARCH_PARAMS, "q": request.query, "maxResults": request.max_results}
+        data = await _make_api_request(url, params)
+        
+        videos = [
+            {
+                "video_id": item['id']['videoId'],
+                "title": (snippet := item['snippet'])['title'],
+                "description": snippet['description'],
+            }
+            for item in data.get('items', ())
+        ]
+        
+        return SearchResponse.model_construct(videos=videos)
+    except Exception as e:
+        raise ValueError(_handle_api_error(e))
+
+
 # Initialize FastMCP
 mcp = FastMCP("YouTube MCP Server")
 
@@ -183,29 +413,24 @@ async def get_youtube_transcript(request: TranscriptRequest) -> TranscriptRespon
     """
     video_id = request.video_id
     
-    # Fetch transcript using youtube-transcript-api
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-        transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-        transcript = " ".join([item['text'] for item in transcript_list])
-    except Exception as e:
-        raise ValueError(_handle_api_error(e))
-    
-    # Fetch video details using YouTube Data API v3
+    # Fetch the transcript (youtube-transcript-api, blocking) on the transcript pool
+    # while the video details are fetched from YouTube Data API v3
     try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {"id": video_id, "part": "snippet"}
-        data = await _make_api_request(url, params)
-        if not data['items']:
+        loop = asyncio.get_running_loop()
+        fetched_transcript, snippet = await asyncio.gather(
+            loop.run_in_executor(_transcript_executor, _fetch_transcript, video_id),
+            _get_video_snippet(video_id),
+        )
+        transcript = " ".join(cue.text for cue in fetched_transcript)
+        if snippet is None:
             raise ValueError("Video not found")
         
-        snippet = data['items'][0]['snippet']
         video_title = snippet['title']
         video_description = snippet['description']
     except Exception as e:
         raise ValueError(_handle_api_error(e))
     
-    return TranscriptResponse(
+    return TranscriptResponse.model_construct(
         transcript=transcript,
         video_title=video_title,
         video_description=video_description
@@ -223,21 +448,7 @@ async def youtube_search_videos(request: SearchRequest) -> SearchResponse:
     Returns:
         SearchResponse with list of videos
     """
-    try:
-        url = "https://www.googleapis.com/youtube/v3/search"
-        params = {"q": request.query, "part": "snippet", "type": "video", "maxResults": request.max_results}
-        data = await _make_api_request(url, params)
-        
-        videos = []
-        for item in data.get('items', []):
-            video_id = item['id']['videoId']
-            title = item['snippet']['title']
-            description = item['snippet']['description']
-            videos.append({"video_id": video_id, "title": title, "description": description})
-        
-        return SearchResponse(videos=videos)
-    except Exception as e:
-        raise ValueError(_handle_api_error(e))
+    return await _search_videos(request)
 
 
 @mcp.tool()
@@ -252,14 +463,11 @@ async def youtube_get_video_details(request: VideoDetailsRequest) -> VideoDetail
         VideoDetailsResponse with video metadata
     """
     try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {"id": request.video_id, "part": "snippet"}
-        data = await _make_api_request(url, params)
-        if not data['items']:
+        snippet = await _get_video_snippet(request.video_id)
+        if snippet is None:
             raise ValueError("Video not found")
         
-        snippet = data['items'][0]['snippet']
-        return VideoDetailsResponse(
+        return VideoDetailsResponse.model_construct(
             video_id=request.video_id,
             title=snippet['title'],
             description=snippet['description'],
@@ -281,16 +489,16 @@ async def youtube_get_comments(request: CommentsRequest) -> CommentsResponse:
         CommentsResponse with list of comments
     """
     try:
-        url = "https://www.googleapis.com/youtube/v3/commentThreads"
-        params = {"videoId": request.video_id, "part": "snippet", "maxResults": request.max_results}
+        url = "/commentThreads"
+        params = {**COMMENTS_PARAMS, "videoId": request.video_id, "maxResults": request.max_results}
         data = await _make_api_request(url, params)
         
-        comments = []
-        for item in data.get('items', []):
-            comment_text = item['snippet']['topLevelComment']['snippet']['textDisplay']
-            comments.append(comment_text)
+        comments = [
+            item['snippet']['topLevelComment']['snippet']['textDisplay']
+            for item in data.get('items', ())
+        ]
         
-        return CommentsResponse(comments=comments)
+        return CommentsResponse.model_construct(comments=comments)
     except Exception as e:
         raise ValueError(_handle_api_error(e))
 
@@ -307,22 +515,26 @@ async def youtube_list_channel_videos(request: SearchRequest) -> SearchResponse:
         SearchResponse with list of videos from the channel
     """
     # Note: This is a simplified implementation; in practice, you'd need channel ID
+    return await _search_videos(request)
+
+
+async def main() -> None:
+    """Run the server and release shared clients and worker threads on shutdown"""
     try:
-        url = "https://www.googleapis.com/youtube/v3/search"
-        params = {"q": request.query, "part": "snippet", "type": "video", "maxResults": request.max_results}
-        data = await _make_api_request(url, params)
-        
-        videos = []
-        for item in data.get('items', []):
-            video_id = item['id']['videoId']
-            title = item['snippet']['title']
-            description = item['snippet']['description']
-            videos.append({"video_id": video_id, "title": title, "description": description})
-        
-        return SearchResponse(videos=videos)
-    except Exception as e:
-        raise ValueError(_handle_api_error(e))
+        await mcp.run_async()
+    finally:
+        _transcript_executor.shutdown(wait=False, cancel_futures=True)
+        for session in _transcript_sessions:
+            session.close()
+        await _client.aclose()
+        if _redis is not None:
+            await _redis.aclose()
 
 
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:  # uvloop is unavailable on Windows; fall back to the stock event loop
+        asyncio.run(main())
+    else:
+        uvloop.run(main())